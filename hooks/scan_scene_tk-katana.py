@@ -51,7 +51,12 @@ class ScanSceneHook(Hook):
         if not scene_name:
             raise TankError("Please Save your file before Publishing")
         
-        scene_path = os.path.abspath(scene_name)
+        # Katana normally hands back an absolute path, so only fall back to
+        # abspath (and its getcwd call) when it doesn't:
+        if os.path.isabs(scene_name):
+            scene_path = os.path.normpath(scene_name)
+        else:
+            scene_path = os.path.abspath(scene_name)
         name = os.path.basename(scene_path)
 
         # create the primary item - this will match the primary output 'scene_item_type':            